@@ -0,0 +1,5 @@
+import os
+import sys
+
+# main.py is served as a top-level module (uvicorn main:app).
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,120 @@
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+client = TestClient(main.app)
+
+
+def test_create_job_reports_body_locations_on_validation_error():
+    response = client.post("/jobs", json={"name": "bracket", "material": {"id": 1}})
+
+    assert response.status_code == 422
+    locations = [error["loc"] for error in response.json()["detail"]]
+    assert ["body", "materialId"] in locations
+    assert ["body", "material", "name"] in locations
+
+
+def test_create_job_rejects_malformed_json():
+    response = client.post(
+        "/jobs", content=b"{", headers={"Content-Type": "application/json"}
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][0] == "body"
+
+
+def test_openapi_request_and_error_refs_resolve():
+    schema = client.get("/openapi.json").json()
+    components = schema["components"]["schemas"]
+    operation = schema["paths"]["/jobs"]["post"]
+
+    body = operation["requestBody"]["content"]["application/json"]["schema"]
+    assert body == {"$ref": "#/components/schemas/SimulationRequest"}
+    assert set(operation["responses"]) == {"200", "422"}
+
+    refs = []
+
+    def collect(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == "$ref":
+                    refs.append(value)
+                else:
+                    collect(value)
+        elif isinstance(node, list):
+            for value in node:
+                collect(value)
+
+    collect(schema)
+    assert refs
+    for ref in refs:
+        assert ref.startswith("#/components/schemas/")
+        assert ref.rsplit("/", 1)[1] in components
+
+
+def _request(**overrides):
+    payload = {
+        "name": "bracket",
+        "materialId": 1,
+        "type": "static",
+        "appliedLoad": 200.0,
+        "material": {
+            "id": 1,
+            "name": "Steel",
+            "youngsModulus": 200.0,
+            "poissonRatio": 0.3,
+            "stressStrainCurve": [
+                {"strain": 0.0, "stress": 0.0},
+                {"strain": 0.01, "stress": 250.0},
+            ],
+        },
+    }
+    payload.update(overrides)
+    return main.SimulationRequest.model_validate(payload)
+
+
+def test_only_light_default_cube_jobs_skip_the_solver():
+    assert not main._needs_full_solve(_request(appliedLoad=500.0))
+    assert main._needs_full_solve(_request(appliedLoad=501.0))
+    assert main._needs_full_solve(_request(appliedLoad=None))
+    assert main._needs_full_solve(_request(geometry={"format": "stl"}))
+    assert main._needs_full_solve(
+        _request(boundaryConditions=[{"type": "fixed", "face": "x-"}])
+    )
+    curveless = _request()
+    curveless.material.stressStrainCurve = []
+    assert main._needs_full_solve(curveless)
+
+
+def test_estimated_results_scale_with_load_and_stiffness():
+    light, _ = main._build_estimated_results("job", _request(appliedLoad=10.0))
+    heavy, _ = main._build_estimated_results("job", _request(appliedLoad=500.0))
+    stiff = _request(appliedLoad=500.0)
+    stiff.material.youngsModulus = 400.0
+    stiffer, _ = main._build_estimated_results("job", stiff)
+
+    assert heavy["maxStress"] == pytest.approx(50 * light["maxStress"])
+    assert heavy["maxDeformation"] == pytest.approx(50 * light["maxDeformation"])
+    assert heavy["safetyFactor"] < light["safetyFactor"]
+    assert stiffer["maxStress"] == heavy["maxStress"]
+    assert stiffer["maxDeformation"] == pytest.approx(heavy["maxDeformation"] / 2)
+
+
+def test_light_job_logs_why_the_solver_was_skipped(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("solver should not run")
+
+    jobs, result_bytes = {}, {}
+    monkeypatch.setattr(main, "_HAS_FENICS", True)
+    monkeypatch.setattr(main, "_solve_with_fenics", fail)
+    monkeypatch.setattr(main, "_jobs", jobs)
+    monkeypatch.setattr(main, "_result_bytes", result_bytes)
+
+    main._run_job("job", _request())
+
+    status = orjson.loads(result_bytes["job"])
+    assert status["status"] == "completed"
+    assert status["results"]["source"] == "fallback"
+    assert "FEniCS solve skipped" in status["artifacts"]["logs"][0]